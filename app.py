@@ -1,9 +1,10 @@
-from flask import Flask, render_template, request, redirect, url_for, session, jsonify, flash
+from flask import Flask, render_template, request, redirect, url_for, session, jsonify, flash, send_from_directory, abort
 from flask_mysqldb import MySQL
 import MySQLdb.cursors
 import pandas as pd
 import numpy as np
 import os
+import json
 from functools import wraps
 import re
 from datetime import datetime
@@ -133,6 +134,38 @@ product_df = pd.DataFrame(sample_products)
 print(f"✓ Loaded {len(product_df)} sample products – generic subcategory images")
 # =============================================================================
 
+# ============ IMAGE VARIANTS (thumb / medium) ============
+# build_images.py offline chalake resized, content-hashed variants banata hai.
+# Manifest na ho to original full-size image hi serve hoti hai.
+IMAGE_BUILD_DIR = os.path.join(app.root_path, 'static', 'images', 'build')
+IMAGE_CACHE_MAX_AGE = 365 * 24 * 60 * 60   # hashed URL kabhi change nahi hota
+
+try:
+    with open(os.path.join(IMAGE_BUILD_DIR, 'manifest.json')) as f:
+        image_manifest = json.load(f)
+    print(f"✓ Loaded image manifest – {len(image_manifest)} images with variants")
+except (OSError, ValueError):
+    image_manifest = {}
+    print("⚠ Image manifest not found – run build_images.py for thumbnails")
+
+# Sirf hashed variant files hi /img/ se serve hongi (manifest.json nahi)
+image_variant_files = {path for variants in image_manifest.values() for path in variants.values()}
+
+def image_url(image_path, variant='thumb'):
+    """
+    Product image ka URL: 'thumb' grid/cart ke liye, 'medium' detail/quick view ke liye.
+    """
+    image_path = image_path or 'default.jpg'
+    variant_path = image_manifest.get(image_path, {}).get(variant)
+    if variant_path:
+        return url_for('image_variant', filename=variant_path)
+    return url_for('static', filename='images/' + image_path)
+
+@app.context_processor
+def inject_image_url():
+    return {'image_url': image_url}
+# =============================================================================
+
 # ============ REFINED CROSS‑SELLING RECOMMENDATION ENGINE ============
 def get_cross_sell_recommendations(product_id, top_n=4):
     """
@@ -358,6 +391,17 @@ def product_detail(product_id):
                          recommendations=recommendations,
                          logged_in=('loggedin' in session))
 
+@app.route('/img/<path:filename>')
+def image_variant(filename):
+    if filename not in image_variant_files:
+        abort(404)
+
+    # Filename me content hash hai, isliye far-future + immutable cache safe hai
+    response = send_from_directory(IMAGE_BUILD_DIR, filename, max_age=IMAGE_CACHE_MAX_AGE)
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
 # ============ AUTH ROUTES ============
 @app.route('/login', methods=['GET', 'POST'])
 def login():
@@ -581,6 +625,7 @@ def profile():
 def api_product_detail(product_id):
     product = get_product_by_id(product_id)
     if product:
+        product['image_url'] = image_url(product['image_path'], 'medium')
         return jsonify({'success': True, 'product': product})
     return jsonify({'success': False, 'message': 'Product not found'})
 
@@ -598,7 +643,8 @@ def api_search():
                 'name': f"{product['Brand']} - {product['Category']}",
                 'category': product['Category'],
                 'price': product['Price'],
-                'image_path': product['image_path']
+                'image_path': product['image_path'],
+                'image_url': image_url(product['image_path'], 'thumb')
             })
     return jsonify({'success': True, 'results': results[:10]})
 
@@ -0,0 +1,73 @@
+"""
+/products page ke image bytes aur render time measure karta hai.
+
+Usage:
+    python build_images.py      # pehle variants banao
+    python bench_images.py
+
+Teen cheezein report hoti hain:
+  - original full-size images vs. thumb variants – pehli visit pe kitne bytes
+  - repeat visit (ETag revalidation) pe kitne bytes
+  - /products HTML render time
+"""
+import os
+import re
+import statistics
+import time
+
+from app import app, product_df
+
+RUNS = 20
+IMG_SRC_RE = re.compile(r'<img[^>]+src="([^"]+)"')
+
+
+def fetch_bytes(client, url, etag=None):
+    headers = {'If-None-Match': etag} if etag else {}
+    response = client.get(url, headers=headers)
+    size = len(response.get_data())
+    etag = response.headers.get('ETag')
+    response.close()
+    return response.status_code, size, etag
+
+
+def main():
+    client = app.test_client()
+
+    # Render time
+    timings = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        response = client.get('/products')
+        timings.append((time.perf_counter() - start) * 1000)
+    html = response.get_data(as_text=True)
+
+    # Browser ek page pe same URL ek hi baar fetch karta hai
+    image_urls = sorted(set(IMG_SRC_RE.findall(html)))
+    images_dir = os.path.join(app.root_path, 'static', 'images')
+    original_bytes = sum(
+        os.path.getsize(os.path.join(images_dir, path))
+        for path in product_df['image_path'].unique()
+    )
+
+    first_view_bytes = 0
+    repeat_view_bytes = 0
+    not_modified = 0
+    for url in image_urls:
+        status, size, etag = fetch_bytes(client, url)
+        first_view_bytes += size
+        status, size, _ = fetch_bytes(client, url, etag)
+        repeat_view_bytes += size
+        not_modified += status == 304
+
+    print("=" * 60)
+    print(f"/products – {len(product_df)} products, {len(image_urls)} unique image URLs")
+    print(f"HTML size:               {len(html.encode()) / 1024:.1f} KB")
+    print(f"Render time (median):    {statistics.median(timings):.2f} ms over {RUNS} runs")
+    print(f"Original images:         {original_bytes / 1024:.1f} KB")
+    print(f"Served images (1st view): {first_view_bytes / 1024:.1f} KB")
+    print(f"Repeat view (ETag):      {repeat_view_bytes / 1024:.1f} KB ({not_modified} x 304)")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""
+Offline image pipeline.
+
+Har product image (static/images/<category>/<Subcategory>.jpg) ke liye
+'thumb' (product grid / cart) aur 'medium' (detail / quick view) variants
+banata hai. Har variant ka naam uske content hash se banta hai, isliye
+browser use hamesha ke liye cache kar sakta hai (immutable URL).
+
+Usage:
+    python build_images.py
+
+Output:
+    static/images/build/<category>/<name>.<variant>.<hash>.jpg
+    static/images/build/manifest.json   { "beauty/Lipstick.jpg": {"thumb": ..., "medium": ...} }
+"""
+import hashlib
+import io
+import json
+import os
+
+from PIL import Image, ImageOps
+
+# Script kahin se bhi chalao, paths app.py ke app.root_path jaise repo root se resolve hote hain
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+IMAGES_DIR = os.path.join(BASE_DIR, 'static', 'images')
+BUILD_DIR = os.path.join(IMAGES_DIR, 'build')
+MANIFEST_PATH = os.path.join(BUILD_DIR, 'manifest.json')
+
+# (max width, max height) – cards 200px high hote hain, 2x screens ke liye thoda bada
+VARIANTS = {
+    'thumb': (400, 400),
+    'medium': (900, 900),
+}
+JPEG_QUALITY = 80
+HASH_LENGTH = 10
+
+
+def find_source_images():
+    """Return relative paths (e.g. 'beauty/Lipstick.jpg') of all original images."""
+    sources = []
+    for root, dirs, files in os.walk(IMAGES_DIR):
+        # Generated files ko dobara process nahi karna
+        dirs[:] = [d for d in dirs if os.path.join(root, d) != BUILD_DIR]
+        for name in files:
+            if name.lower().endswith(('.jpg', '.jpeg', '.png')):
+                rel_path = os.path.relpath(os.path.join(root, name), IMAGES_DIR)
+                sources.append(rel_path.replace(os.sep, '/'))
+    return sorted(sources)
+
+
+def render_variant(source_path, size):
+    """Resize image to fit inside `size` and return encoded JPEG bytes."""
+    with Image.open(source_path) as img:
+        is_jpeg = img.format == 'JPEG'
+        img = ImageOps.exif_transpose(img)
+
+        # Transparent PNG ko seedha RGB karne se background kaala ho jaata hai – white pe flatten karo
+        if img.mode in ('RGBA', 'LA', 'P'):
+            img = img.convert('RGBA')
+            background = Image.new('RGB', img.size, (255, 255, 255))
+            background.paste(img, mask=img.getchannel('A'))
+            img = background
+        else:
+            img = img.convert('RGB')
+
+        img.thumbnail(size, Image.LANCZOS)
+        buffer = io.BytesIO()
+        img.save(buffer, 'JPEG', quality=JPEG_QUALITY, optimize=True, progressive=True)
+    data = buffer.getvalue()
+
+    # Chhoti images re-encode karne se badi ho jaati hain – tab original hi rakho
+    if is_jpeg:
+        with open(source_path, 'rb') as f:
+            original = f.read()
+        if len(original) <= len(data):
+            return original
+    return data
+
+
+def build():
+    manifest = {}
+    written = set()
+
+    for rel_path in find_source_images():
+        stem, _ = os.path.splitext(rel_path)
+        manifest[rel_path] = {}
+
+        for variant, size in VARIANTS.items():
+            data = render_variant(os.path.join(IMAGES_DIR, rel_path), size)
+            digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+            # Medium aur thumb same bytes ho to ek hi URL (browser cache hit)
+            existing = [p for p in manifest[rel_path].values() if p.endswith(f".{digest}.jpg")]
+            if existing:
+                manifest[rel_path][variant] = existing[0]
+                continue
+
+            variant_path = f"{stem}.{variant}.{digest}.jpg"
+            output_path = os.path.join(BUILD_DIR, variant_path)
+
+            # Same hash = same bytes, dobara likhne ki zarurat nahi
+            if not os.path.exists(output_path):
+                os.makedirs(os.path.dirname(output_path), exist_ok=True)
+                with open(output_path, 'wb') as f:
+                    f.write(data)
+
+            manifest[rel_path][variant] = variant_path
+            written.add(os.path.normpath(output_path))
+
+    # Purane hash wale files hata do
+    for root, _, files in os.walk(BUILD_DIR):
+        for name in files:
+            path = os.path.normpath(os.path.join(root, name))
+            if path != os.path.normpath(MANIFEST_PATH) and path not in written:
+                os.remove(path)
+
+    os.makedirs(BUILD_DIR, exist_ok=True)
+    with open(MANIFEST_PATH, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    print(f"✓ {len(manifest)} images → {len(written)} variants in {BUILD_DIR}")
+
+
+if __name__ == '__main__':
+    build()
@@ -162,7 +162,7 @@ function displayLiveSearchResults(results) {
     results.forEach(result => {
         html += `
             <a href="/product/${result.id}" class="live-search-item">
-                <img src="/static/images/${result.image}" alt="${result.name}">
+                <img src="${result.image_url}" alt="${result.name}">
                 <div>
                     <h6>${result.name}</h6>
                     <p class="text-muted">${result.category}</p>
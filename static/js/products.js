@@ -346,7 +346,7 @@ function showQuickViewModal(product) {
     const content = `
         <div class="row">
             <div class="col-md-6">
-                <img src="/static/${product.image_path || 'default.jpg'}" 
+                <img src="${product.image_url}" 
                      class="img-fluid rounded" 
                      alt="${product.Brand}">
             </div>